@@ -1,13 +1,31 @@
+import time
+
 import streamlit as st
+import numpy as np
+import orjson
 import requests
-from shapely.geometry import shape
-from shapely.ops import transform
-from pyproj import CRS, Transformer
+import diskcache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from calc import M2_TO_SQFT, calculate_results
 
 # -----------------------------
 # Config / Constants
 # -----------------------------
 PVGIS_API = "https://re.jrc.ec.europa.eu/api/v5_2/PVcalc"
+# Only lat/lon vary between calls; the fixed parameters are encoded once
+# here instead of dict->querystring encoding on every request.
+PVGIS_URL = PVGIS_API + "?peakpower=1&loss=14&pvtechchoice=crystSi&outputformat=json&lat={lat}&lon={lon}"
+
+OVERPASS_API = "http://overpass-api.de/api/interpreter"
+OVERPASS_QUERY = '[out:json];way(around:30,{lat},{lon})["building"];out geom;'
 
 STATE_IRRADIANCES = {
     "Andhra Pradesh": 1700, "Arunachal Pradesh": 1400, "Assam": 1500, "Bihar": 1600,
@@ -33,11 +51,7 @@ STATE_TARIFFS = {
     "Dadra and Nagar Haveli and Daman and Diu": 7.0, "Lakshadweep": 6.5, "Delhi": 8.0
 }
 
-PANEL_EFFICIENCY = 0.20
-SYSTEM_DERATE = 0.85
-COST_PER_KW = 50000  # INR
-CO2_FACTOR = 0.82   # kg CO₂ / kWh
-KW_PER_M2 = 0.143   # realistic capacity per m²
+ORIENTATION_FACTORS = {"South (best)": 1.0, "East": 0.8, "West": 0.8, "North": 0.5}
 
 HOUSE_TYPE_AREA = {
     "Villa": 250,
@@ -48,112 +62,202 @@ HOUSE_TYPE_AREA = {
 }
 
 MAX_RESIDENTIAL_ROOF = 500  # m² threshold for realistic roof area
-M2_TO_SQFT = 10.7639  # conversion factor
+
+# Widget option sequences, built once instead of per rerun.
+STATE_OPTIONS = tuple(STATE_IRRADIANCES)
+HOUSE_TYPE_OPTIONS = tuple(HOUSE_TYPE_AREA)
+ORIENTATION_OPTIONS = tuple(ORIENTATION_FACTORS)
+
+# Streamlit re-executes this script top to bottom on every rerun, so
+# long-lived resources live behind st.cache_resource factories: they are
+# built once per server process, not once per rerun.
+@st.cache_resource(show_spinner=False)
+def _session():
+    # Shared session: keep-alive avoids a fresh TCP+TLS handshake per call.
+    s = requests.Session()
+    s.headers.update({"User-Agent": "SolarApp/1.0 (your_email@example.com)"})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            # Retry's default method list excludes POST, which would
+            # leave Overpass — queried via POST, and the most throttled
+            # API here — without retries. Safe to include: the POST body
+            # is a read-only query.
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            respect_retry_after_header=True,
+        ),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+@st.cache_resource(show_spinner=False)
+def _disk_cache():
+    # On-disk cache so slow external lookups survive process restarts.
+    return diskcache.Cache(".solarapp_cache")
+
+@st.cache_resource(show_spinner=False)
+def _executor():
+    # Long-lived pool for the Overpass/PVGIS fan-out. A per-call
+    # `with ThreadPoolExecutor(...)` would shutdown(wait=True) on exit
+    # and block on a hung fetch despite the result timeout; this pool is
+    # never shut down, so timed-out futures are simply abandoned.
+    return ThreadPoolExecutor(max_workers=4)
+
+SESSION = _session()
+DISK_CACHE = _disk_cache()
+OVERPASS_TTL = 7 * 86400   # building footprints barely change
+OVERPASS_MISS_TTL = 3600   # don't hammer Overpass when nothing was found
+PVGIS_TTL = 30 * 86400     # long-term irradiance averages are static
+
+# Failed lookups are remembered for a minute so an API outage costs one
+# timeout, not one per rerun. st.cache_data never caches the raised
+# exceptions, so a transient failure is retried once the entry expires.
+NEG_TTL = 60  # seconds
+
+@st.cache_resource(show_spinner=False)
+def _neg_cache():
+    return {}
+
+_NEG = _neg_cache()
+
+def _failed_recently(key):
+    expires = _NEG.get(key)
+    return expires is not None and expires > time.time()
 
 # -----------------------------
 # Helper functions
 # -----------------------------
 def geocode_address(address):
+    # Normalize so "Delhi" and " delhi " share one cache entry.
+    address = address.strip().lower()
+    key = ("geocode", address)
+    if _failed_recently(key):
+        return None, None, None
     try:
-        url = "https://nominatim.openstreetmap.org/search"
-        params = {"q": address, "format": "json", "limit": 1}
-        headers = {"User-Agent": "SolarApp/1.0 (your_email@example.com)"}
-        r = requests.get(url, params=params, headers=headers, timeout=10)
-        if r.status_code == 200 and r.json():
-            data = r.json()[0]
-            return float(data["lat"]), float(data["lon"]), data.get("display_name", "")
-    except:
-        pass
-    return None, None, None
+        return _geocode_address_cached(address)
+    except Exception:
+        _NEG[key] = time.time() + NEG_TTL
+        return None, None, None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _geocode_address_cached(address):
+    url = "https://nominatim.openstreetmap.org/search"
+    params = {"q": address, "format": "json", "limit": 1}
+    r = SESSION.get(url, params=params, timeout=(3, 10))
+    if r.status_code != 200:
+        raise LookupError(f"Nominatim returned {r.status_code}")
+    payload = orjson.loads(r.content)
+    if not payload:
+        # A real "no such address" answer — cacheable, not an outage.
+        return None, None, None
+    data = payload[0]
+    return float(data["lat"]), float(data["lon"]), data.get("display_name", "")
 
 def get_building_polygon(lat, lon):
+    lat, lon = round(lat, 4), round(lon, 4)
+    key = ("overpass", lat, lon)
+    if _failed_recently(key):
+        return None
     try:
-        overpass_url = "http://overpass-api.de/api/interpreter"
-        query = f"""
-        [out:json];
-        way(around:30,{lat},{lon})["building"];
-        out geom;
-        """
-        r = requests.get(overpass_url, params={"data": query}, timeout=15)
-        if r.status_code != 200 or not r.json().get("elements"):
-            return None
-        coords = [(pt["lon"], pt["lat"]) for pt in r.json()["elements"][0]["geometry"]]
-        poly = {"type": "Polygon", "coordinates": [coords]}
-        return compute_area(poly)
-    except:
+        return _building_polygon_cached(lat, lon)
+    except Exception:
+        _NEG[key] = time.time() + NEG_TTL
         return None
 
-def compute_area(geojson_polygon):
-    geom = shape(geojson_polygon)
-    transformer = Transformer.from_crs(
-        CRS.from_epsg(4326),
-        CRS.from_proj4(
-            "+proj=aea +lat_1={} +lat_2={} +lon_0={} +datum=WGS84".format(
-                geom.bounds[1], geom.bounds[3], (geom.bounds[0] + geom.bounds[2]) / 2
-            )
-        ),
-        always_xy=True
-    )
-    return transform(transformer.transform, geom).area
+@st.cache_data(ttl=86400, show_spinner=False)
+def _building_polygon_cached(lat, lon):
+    key = ("overpass", lat, lon)
+    if key in DISK_CACHE:
+        area = DISK_CACHE[key]
+    else:
+        area = _fetch_building_area(lat, lon)
+        # Negative-cache misses too, with a short TTL, so a bad coordinate
+        # doesn't re-trigger the 15 s Overpass query on every session.
+        DISK_CACHE.set(key, area, expire=OVERPASS_TTL if area is not None else OVERPASS_MISS_TTL)
+    if area is None:
+        # Raise rather than return None: st.cache_data would hold the
+        # miss for its full 24 h TTL, overriding the one-hour disk entry
+        # that is meant to govern when a miss is retried. The caller
+        # translates this back to None.
+        raise LookupError("no building found")
+    return area
+
+def _fetch_building_area(lat, lon):
+    query = OVERPASS_QUERY.format(lat=lat, lon=lon)
+    # POST body instead of URL-encoded GET: no querystring encoding,
+    # no 414 risk, and Overpass throttles POSTs less aggressively.
+    # The context manager releases the streamed connection back to the
+    # pool even when we stop reading after the first element.
+    with SESSION.post(OVERPASS_API, data={"data": query}, timeout=(3, 15), stream=True) as r:
+        if r.status_code != 200:
+            raise LookupError(f"Overpass returned {r.status_code}")
+        if ijson is not None:
+            # Overpass returns every building in the radius; stream-parse
+            # and stop at the first element instead of decoding them all.
+            r.raw.decode_content = True
+            first = next(ijson.items(r.raw, "elements.item"), None)
+        else:
+            elements = orjson.loads(r.content).get("elements")
+            first = elements[0] if elements else None
+    if not first:
+        # No building mapped here — a cacheable answer, not an outage.
+        return None
+    # A way's geometry is a single exterior ring, so no shapely needed.
+    coords = [(pt["lon"], pt["lat"]) for pt in first["geometry"]]
+    return _ring_area(coords)
+
+R_EARTH = 6378137.0  # m, WGS84 equatorial radius
+
+def _ring_area(coords):
+    # Shoelace on a local equal-area projection around the ring centroid;
+    # for a ~10-vertex roof this skips shapely/GEOS/PROJ entirely.
+    lons, lats = np.asarray(coords, dtype=float).T
+    lat0 = lats.mean()
+    x = np.radians(lons - lons.mean()) * np.cos(np.radians(lat0)) * R_EARTH
+    y = np.radians(lats - lat0) * R_EARTH
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
 
 def get_pvgis_irradiance(lat, lon):
+    # Round so nearby points (~100 m) share a cache entry.
+    lat, lon = round(lat, 3), round(lon, 3)
+    key = ("pvgis", lat, lon)
+    if _failed_recently(key):
+        return None
     try:
-        params = {
-            "lat": lat,
-            "lon": lon,
-            "peakpower": 1,
-            "loss": 14,
-            "pvtechchoice": "crystSi",
-            "outputformat": "json"
-        }
-        r = requests.get(PVGIS_API, params=params, timeout=15)
-        if r.status_code == 200:
-            data = r.json()
-            e_y = data.get("outputs", {}).get("totals", {}).get("fixed", {}).get("E_y", None)
-            if e_y:
-                st.info(f"PVGIS annual irradiance found: {e_y:.2f} kWh/m²/yr")
-                return e_y
-    except:
-        pass
-    return None
-
-def calculate_results(area_m2, shadow_free_m2, irradiance, orientation_factor, tariff):
-    effective_area = min(area_m2, shadow_free_m2)
-
-    # Max installable capacity based on roof area
-    max_capacity_kw = effective_area * KW_PER_M2
-
-    # Physics-based annual generation
-    raw_annual_gen = effective_area * irradiance * PANEL_EFFICIENCY * SYSTEM_DERATE * orientation_factor
-
-    # Capacity limited by roof area
-    capacity_kw = min(raw_annual_gen / 1500, max_capacity_kw)
-
-    # Annual generation adjusted to practical capacity
-    annual_gen = capacity_kw * 1500
-
-    annual_savings = annual_gen * tariff
-    inst_cost = capacity_kw * COST_PER_KW
-    payback_years = inst_cost / annual_savings if annual_savings > 0 else None
-    co2_tons = (annual_gen * CO2_FACTOR) / 1000
-
-    return {
-        "effective_area": effective_area,
-        "capacity_kw": capacity_kw,
-        "annual_gen": annual_gen,
-        "annual_savings": annual_savings,
-        "payback_years": payback_years,
-        "co2_tons": co2_tons,
-        "inst_cost": inst_cost
-    }
+        return _pvgis_irradiance_cached(lat, lon)
+    except Exception:
+        _NEG[key] = time.time() + NEG_TTL
+        return None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _pvgis_irradiance_cached(lat, lon):
+    # Same two-tier scheme as Overpass: diskcache rides out process
+    # restarts and Streamlit Cloud cold boots.
+    key = ("pvgis", lat, lon)
+    if key in DISK_CACHE:
+        return DISK_CACHE[key]
+    e_y = _fetch_pvgis(lat, lon)
+    DISK_CACHE.set(key, e_y, expire=PVGIS_TTL)
+    return e_y
+
+def _fetch_pvgis(lat, lon):
+    r = SESSION.get(PVGIS_URL.format(lat=lat, lon=lon), timeout=(3, 10))
+    if r.status_code != 200:
+        raise LookupError(f"PVGIS returned {r.status_code}")
+    data = orjson.loads(r.content)
+    e_y = data.get("outputs", {}).get("totals", {}).get("fixed", {}).get("E_y", None)
+    return e_y if e_y else None
+
+PANEL_TYPES = ("Monocrystalline", "Polycrystalline", "Thin-Film")
 
 def recommend_panel(roof_area_sqft):
-    if roof_area_sqft < 500:
-        return "Monocrystalline"
-    elif 500 <= roof_area_sqft <= 1000:
-        return "Polycrystalline"
-    else:
-        return "Thin-Film"
+    # Index by bucket: <500, 500–1000 inclusive, >1000 sq ft.
+    return PANEL_TYPES[(roof_area_sqft >= 500) + (roof_area_sqft > 1000)]
 
 # -----------------------------
 # Streamlit UI
@@ -161,83 +265,161 @@ def recommend_panel(roof_area_sqft):
 st.title("☀️ Solar Rooftop Estimation Tool")
 st.markdown("Estimate rooftop solar capacity, energy generation, savings, CO₂ benefits, and recommended panel type.")
 
-area_method = st.radio("Select roof area input method:", ["Enter directly", "Select house type"])
-roof_area_m2 = None
-roof_area_sqft = None
-lat = lon = None
-location_name = ""
-address = ""
-
-if area_method == "Enter directly":
-    roof_area_sqft = st.number_input("Enter roof area (sq ft):", min_value=100.0, step=50.0)
-    roof_area_m2 = roof_area_sqft / M2_TO_SQFT
-    address = st.text_input("Enter address (for irradiance):")
-else:
-    house_type = st.selectbox("Select house type:", list(HOUSE_TYPE_AREA.keys()))
-    roof_area_sqft = float(HOUSE_TYPE_AREA.get(house_type, 100))
-    roof_area_m2 = roof_area_sqft / M2_TO_SQFT
-    st.info(f"Using default roof area for {house_type}: {roof_area_sqft:.2f} sq ft")
-    address = st.text_input("Enter address (for irradiance):")
+class DegradedPipeline(Exception):
+    # Raised instead of returning when a wanted fetch came back empty, so
+    # st.cache_data (which never caches exceptions) cannot pin a fallback
+    # result for an hour — the chunk0-19 negative cache keeps governing
+    # retries. Carries the fallback payload for the caller to render.
+    def __init__(self, payload):
+        super().__init__("pipeline fell back to defaults")
+        self.payload = payload
 
-if st.button("Use Demo Address"):
-    address = "India Gate, Delhi"
-    st.info(f"Demo address selected: {address}")
+@st.cache_data(ttl=3600, show_spinner="Looking up irradiance and roof data…")
+def compute_everything(address, area_method, roof_area_m2, shadow_free_m2,
+                       orientation_factor, tariff, state):
+    # Full geocode -> fetch -> calculate pipeline, keyed on every input:
+    # a repeat Calculate with unchanged inputs is a pure cache lookup.
+    lat = lon = None
+    location_name = ""
+    detected_sqft = None
+    pvgis_irradiance = None
+    if address:
+        lat, lon, location_name = geocode_address(address)
+        if lat and lon:
+            if area_method == "Get from address":
+                # Overpass and PVGIS are independent once we have lat/lon:
+                # overlap the two round-trips instead of paying them serially.
+                ex = _executor()
+                f_poly = ex.submit(get_building_polygon, lat, lon)
+                f_irr = ex.submit(get_pvgis_irradiance, lat, lon)
+                # Collect each future independently so one stuck or
+                # failing call never loses the other's answer.
+                try:
+                    building_area_m2 = f_poly.result(timeout=20)
+                except Exception:
+                    building_area_m2 = None
+                try:
+                    pvgis_irradiance = f_irr.result(timeout=20)
+                except Exception:
+                    pvgis_irradiance = None
+                if building_area_m2 and building_area_m2 <= MAX_RESIDENTIAL_ROOF:
+                    roof_area_m2 = building_area_m2
+                    detected_sqft = roof_area_m2 * M2_TO_SQFT
+            else:
+                pvgis_irradiance = get_pvgis_irradiance(lat, lon)
 
-# -----------------------------
-# State & tariff selection
-# -----------------------------
-state = st.selectbox("Select state/UT:", list(STATE_IRRADIANCES.keys()))
-tariff = st.number_input("Electricity tariff (₹/kWh):", value=STATE_TARIFFS.get(state, 7.0))
-
-# Shadow-free input
-st.markdown("**Shadow-free area:** Area of roof available for panels (sq ft).")
-shadow_free_sqft = st.number_input(
-    "Enter shadow-free area (sq ft):",
-    min_value=50.0,
-    value=float(roof_area_sqft) if roof_area_sqft else 100.0,
-    step=10.0
+    if pvgis_irradiance:
+        irradiance = pvgis_irradiance
+        irradiance_source = "PVGIS"
+    else:
+        irradiance = STATE_IRRADIANCES.get(state, 1700)
+        irradiance_source = "state average"
+
+    results = None
+    if roof_area_m2:
+        results = calculate_results(roof_area_m2, shadow_free_m2, irradiance,
+                                    orientation_factor, tariff)
+    payload = {
+        "location_name": location_name,
+        "detected_sqft": detected_sqft,
+        "irradiance": irradiance,
+        "irradiance_source": irradiance_source,
+        "results": results,
+    }
+    # An address was given but something it should have produced is
+    # missing: geocode failed, PVGIS fell back to the state average, or
+    # the requested footprint was not found. Don't cache that.
+    if address and (lat is None or pvgis_irradiance is None or
+                    (area_method == "Get from address" and detected_sqft is None)):
+        raise DegradedPipeline(payload)
+    return payload
+
+area_method = st.radio(
+    "Select roof area input method:",
+    ["Enter directly", "Select house type", "Get from address"]
 )
-shadow_free_m2 = shadow_free_sqft / M2_TO_SQFT
 
-orientation = st.selectbox("Orientation of panels:", ["South (best)", "North"])
-orientation_factor = {"South (best)": 1.0, "North": 0.5}[orientation]
+if st.button("Use Demo Address"):
+    st.session_state["address"] = "India Gate, Delhi"
+    st.info("Demo address selected: India Gate, Delhi")
 
-# -----------------------------
-# Geocode + PVGIS
-# -----------------------------
-irradiance_source = "state average"
-if address:
-    lat, lon, location_name = geocode_address(address)
-    if lat and lon:
-        pvgis_irradiance = get_pvgis_irradiance(lat, lon)
-        if pvgis_irradiance:
-            irradiance = pvgis_irradiance
-            irradiance_source = "PVGIS"
-        else:
-            irradiance = STATE_IRRADIANCES.get(state, 1700)
+# The form batches every input into one rerun on submit, instead of
+# rerunning the script (and the pipeline) on each keystroke or slider tick.
+with st.form("calc"):
+    roof_area_m2 = None
+    roof_area_sqft = None
+
+    if area_method == "Enter directly":
+        roof_area_sqft = st.number_input("Enter roof area (sq ft):", min_value=100.0, step=50.0)
+        roof_area_m2 = roof_area_sqft / M2_TO_SQFT
+        address = st.text_input("Enter address (for irradiance):", key="address")
+    elif area_method == "Select house type":
+        house_type = st.selectbox("Select house type:", HOUSE_TYPE_OPTIONS)
+        roof_area_sqft = float(HOUSE_TYPE_AREA.get(house_type, 100))
+        roof_area_m2 = roof_area_sqft / M2_TO_SQFT
+        st.info(f"Using default roof area for {house_type}: {roof_area_sqft:.2f} sq ft")
+        address = st.text_input("Enter address (for irradiance):", key="address")
     else:
-        irradiance = STATE_IRRADIANCES.get(state, 1700)
-else:
-    irradiance = STATE_IRRADIANCES.get(state, 1700)
+        address = st.text_input("Enter address (roof detected from OpenStreetMap):", key="address")
+
+    # State & tariff selection
+    state = st.selectbox("Select state/UT:", STATE_OPTIONS)
+    tariff = st.number_input("Electricity tariff (₹/kWh):", value=STATE_TARIFFS.get(state, 7.0))
+
+    # Shadow-free input. The default is seeded through session state
+    # instead of a dynamic value=: a value= derived from the roof area
+    # changes the widget's identity when the roof input changes, which
+    # inside a form would throw away what the user typed here.
+    if "shadow_free_sqft" not in st.session_state:
+        st.session_state["shadow_free_sqft"] = float(roof_area_sqft) if roof_area_sqft else 100.0
+    st.markdown("**Shadow-free area:** Area of roof available for panels (sq ft).")
+    shadow_free_sqft = st.number_input(
+        "Enter shadow-free area (sq ft):",
+        min_value=50.0,
+        step=10.0,
+        key="shadow_free_sqft"
+    )
+    shadow_free_m2 = shadow_free_sqft / M2_TO_SQFT
+
+    orientation = st.selectbox("Orientation of panels:", ORIENTATION_OPTIONS)
+    orientation_factor = ORIENTATION_FACTORS[orientation]
 
-st.info(f"Irradiance used for calculation: {irradiance:.2f} kWh/m²/yr ({irradiance_source})")
+    submitted = st.form_submit_button("🔍 Calculate Solar Potential")
 
 # -----------------------------
 # Calculate
 # -----------------------------
-if st.button("🔍 Calculate Solar Potential"):
-    if roof_area_m2:
-        results = calculate_results(roof_area_m2, shadow_free_m2, irradiance, orientation_factor, tariff)
+if submitted:
+    # The one degenerate input the widgets allow: address-detected mode
+    # with no address. Stop before the pipeline rather than after it.
+    if area_method == "Get from address" and not address.strip():
+        st.error("Please enter an address so the roof can be detected.")
+        st.stop()
+
+    try:
+        pipeline = compute_everything(address, area_method, roof_area_m2, shadow_free_m2,
+                                      orientation_factor, tariff, state)
+    except DegradedPipeline as degraded:
+        pipeline = degraded.payload
+
+    if area_method == "Get from address" and address:
+        if pipeline["detected_sqft"]:
+            roof_area_sqft = pipeline["detected_sqft"]
+            st.info(f"Detected building footprint: {roof_area_sqft:.2f} sq ft")
+        else:
+            st.warning("Could not detect a realistic building footprint — enter the roof area directly.")
+
+    if pipeline["irradiance_source"] == "PVGIS":
+        st.info(f"PVGIS annual irradiance found: {pipeline['irradiance']:.2f} kWh/m²/yr")
+    st.info(f"Irradiance used for calculation: {pipeline['irradiance']:.2f} kWh/m²/yr ({pipeline['irradiance_source']})")
+
+    results = pipeline["results"]
+    if results:
         panel_type = recommend_panel(roof_area_sqft)
 
         with st.expander("📊 Results"):
-            st.write(f"**Effective Area:** {results['effective_area']*M2_TO_SQFT:.2f} sq ft")
-            st.write(f"**Solar Capacity:** {results['capacity_kw']:.2f} kW")
-            st.write(f"**Annual Generation:** {results['annual_gen']:.2f} kWh")
-            st.write(f"**Annual Savings:** ₹{results['annual_savings']:.2f}")
-            st.write(f"**Installation Cost:** ₹{results['inst_cost']:.2f}")
-            st.write(f"**Payback Period:** {results['payback_years']:.2f} years")
-            st.write(f"**CO₂ Saved:** {results['co2_tons']:.2f} tons/year")
+            for label, value in results["display"].items():
+                st.write(f"**{label}:** {value}")
             st.write(f"**Recommended Panel Type:** {panel_type}")
     else:
         st.error("Please enter a valid roof area or select house type.")
@@ -0,0 +1,96 @@
+# Pure-arithmetic result kernel, kept out of the Streamlit script so the
+# JIT-compiled function survives reruns and can be reused for batch modes.
+import numpy as np
+from numba import njit, float64
+from numba.core.types import UniTuple
+
+PANEL_EFFICIENCY = 0.20
+SYSTEM_DERATE = 0.85
+COST_PER_KW = 50000  # INR
+M2_TO_SQFT = 10.7639  # conversion factor
+CO2_FACTOR = 0.82   # kg CO₂ / kWh
+KW_PER_M2 = 0.143   # realistic capacity per m²
+SPECIFIC_YIELD = 1500  # kWh per kW per year used to size capacity
+
+# Folded once at import; the kernels multiply by this instead of
+# recomputing efficiency * derate on every call.
+GEN_FACTOR = PANEL_EFFICIENCY * SYSTEM_DERATE
+
+# Declaring the signature compiles the kernel at import (and loads it
+# from the on-disk cache thereafter) instead of on the first click.
+@njit(UniTuple(float64, 7)(float64, float64, float64, float64, float64),
+      cache=True, fastmath=True)
+def _calc_core(area_m2, shadow_free_m2, irradiance, orientation_factor, tariff):
+    effective_area = min(area_m2, shadow_free_m2)
+
+    # Max installable capacity based on roof area
+    max_capacity_kw = effective_area * KW_PER_M2
+
+    # Physics-based annual generation
+    raw_annual_gen = effective_area * irradiance * GEN_FACTOR * orientation_factor
+
+    # Capacity limited by roof area
+    capacity_kw = min(raw_annual_gen / SPECIFIC_YIELD, max_capacity_kw)
+
+    # Annual generation adjusted to practical capacity
+    annual_gen = capacity_kw * SPECIFIC_YIELD
+
+    annual_savings = annual_gen * tariff
+    inst_cost = capacity_kw * COST_PER_KW
+    payback_years = inst_cost / annual_savings if annual_savings > 0 else -1.0
+    co2_tons = (annual_gen * CO2_FACTOR) / 1000
+
+    return (effective_area, capacity_kw, annual_gen, annual_savings, payback_years, inst_cost, co2_tons)
+
+def calculate_results_vec(area_m2, shadow_free_m2, irradiance, orientation_factor, tariff):
+    effective_area = np.minimum(area_m2, shadow_free_m2)
+    max_capacity_kw = effective_area * KW_PER_M2
+    raw_annual_gen = effective_area * irradiance * GEN_FACTOR * orientation_factor
+    capacity_kw = np.minimum(raw_annual_gen / SPECIFIC_YIELD, max_capacity_kw)
+    annual_gen = capacity_kw * SPECIFIC_YIELD
+    annual_savings = annual_gen * tariff
+    inst_cost = capacity_kw * COST_PER_KW
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payback_years = np.where(annual_savings > 0, inst_cost / annual_savings, np.nan)
+    co2_tons = (annual_gen * CO2_FACTOR) / 1000
+    return {
+        "effective_area": effective_area,
+        "capacity_kw": capacity_kw,
+        "annual_gen": annual_gen,
+        "annual_savings": annual_savings,
+        "payback_years": payback_years,
+        "co2_tons": co2_tons,
+        "inst_cost": inst_cost
+    }
+
+def calculate_results(area_m2, shadow_free_m2, irradiance, orientation_factor, tariff):
+    args = (area_m2, shadow_free_m2, irradiance, orientation_factor, tariff)
+    # Array inputs (sensitivity sweeps, what-if charts) broadcast through
+    # the NumPy branch; scalar inputs keep the jitted kernel.
+    if any(isinstance(a, np.ndarray) for a in args):
+        return calculate_results_vec(*(np.asarray(a, dtype=float) for a in args))
+    eff, cap, gen, sav, payback, cost, co2 = _calc_core(
+        float(area_m2), float(shadow_free_m2), float(irradiance),
+        float(orientation_factor), float(tariff)
+    )
+    return {
+        "effective_area": eff,
+        "capacity_kw": cap,
+        "annual_gen": gen,
+        "annual_savings": sav,
+        "payback_years": payback if payback >= 0 else None,
+        "co2_tons": co2,
+        "inst_cost": cost,
+        # Pre-rendered labels: the UI writes these as-is, so an unrelated
+        # widget change never re-runs seven float formats, and a zero-
+        # savings payback displays as a dash instead of crashing ':.2f'.
+        "display": {
+            "Effective Area": f"{eff * M2_TO_SQFT:.2f} sq ft",
+            "Solar Capacity": f"{cap:.2f} kW",
+            "Annual Generation": f"{gen:.2f} kWh",
+            "Annual Savings": f"₹{sav:.2f}",
+            "Installation Cost": f"₹{cost:.2f}",
+            "Payback Period": f"{payback:.2f} years" if payback >= 0 else "—",
+            "CO₂ Saved": f"{co2:.2f} tons/year",
+        }
+    }